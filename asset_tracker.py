@@ -1,10 +1,15 @@
 import sys
 import os
+import hashlib
+import hmac
 import sqlite3
-from datetime import datetime
-from typing import List, Tuple, Optional
+import threading
+from contextlib import contextmanager
+from itertools import chain
+from time import gmtime, strftime, time_ns
+from typing import Dict, Iterator, List, Tuple, Optional
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QObject, QRunnable, Qt, QThreadPool, Signal
 from PySide6.QtGui import QIntValidator
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QTabWidget, QVBoxLayout,
@@ -14,183 +19,354 @@ from PySide6.QtWidgets import (
 
 DB_FILE = "assets.db"
 DEFAULT_ITEM_TYPES = ["Mouse", "Keyboard", "Controller", "Headset"]
+DEFAULT_ADMIN_PASSWORD = "admin123"
+MAX_ASSET_ID = 10**9
+REPORT_BATCH_SIZE = 256  # rows fetched per lock acquisition when streaming the report
+
+
+def now_ms() -> int:
+    return time_ns() // 1_000_000
+
+
+def format_ts(ms: Optional[int]) -> str:
+    """Render an epoch-ms timestamp as UTC ISO-8601 with millisecond precision ("" for NULL)."""
+    if ms is None:
+        return ""
+    secs, millis = divmod(ms, 1000)
+    return f"{strftime('%Y-%m-%dT%H:%M:%S', gmtime(secs))}.{millis:03d}"
+
+
+def format_row(row: Tuple) -> Tuple[str, str, str, str, str]:
+    """Render a list_assets() row as the inventory table's cell texts."""
+    asset_id, asset_type, status, checked_out_by, checked_out_at = row
+    return str(asset_id), asset_type, status, checked_out_by or "", format_ts(checked_out_at)
+
+
+def norm_name(name: Optional[str]) -> str:
+    """Normalize a student name for comparison (trimmed, case-insensitive)."""
+    return (name or "").strip().lower()
+
+
+def hash_password(password: str, salt: Optional[bytes] = None) -> str:
+    """Return a salted scrypt hash of password as "salt$digest" (hex)."""
+    salt = os.urandom(16) if salt is None else salt
+    digest = hashlib.scrypt(password.encode("utf-8"), salt=salt, n=2**14, r=8, p=1)
+    return f"{salt.hex()}${digest.hex()}"
+
+
+def verify_password(password: str, stored: str) -> bool:
+    salt_hex = stored.partition("$")[0]
+    return hmac.compare_digest(hash_password(password, bytes.fromhex(salt_hex)), stored)
+
+# ---------------------------- SQL Statements ---------------------------- #
+# Timestamps are stored as INTEGER milliseconds since the Unix epoch (UTC)
+# and only formatted for display.
+
+# Assets keyed by (asset_type, asset_id); WITHOUT ROWID stores rows directly in the PK B-tree
+SQL_CREATE_ASSETS = """
+CREATE TABLE IF NOT EXISTS assets (
+    asset_type TEXT NOT NULL,
+    asset_id   INTEGER NOT NULL,
+    status TEXT NOT NULL DEFAULT 'available',
+    checked_out_by TEXT,
+    checked_out_at INTEGER, -- epoch ms
+    PRIMARY KEY (asset_type, asset_id)
+) WITHOUT ROWID
+"""
+# History (append-only audit)
+SQL_CREATE_HISTORY = """
+CREATE TABLE IF NOT EXISTS history (
+    event_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    asset_type TEXT NOT NULL,
+    asset_id   INTEGER NOT NULL,
+    action TEXT NOT NULL, -- added | checked_out | checked_in | removed
+    actor TEXT,
+    timestamp INTEGER NOT NULL -- epoch ms
+)
+"""
+# Settings (key-value). Stores admin_password_hash, etc.
+SQL_CREATE_SETTINGS = """
+CREATE TABLE IF NOT EXISTS settings (
+    key TEXT PRIMARY KEY,
+    value TEXT
+) WITHOUT ROWID
+"""
+# Legacy ISO-8601 text -> epoch ms (2440587.5 is the Julian day of 1970-01-01); other values pass through
+SQL_ISO_TO_MS = (
+    "CASE WHEN typeof({col}) = 'text'"
+    " THEN CAST(ROUND((julianday({col}) - 2440587.5) * 86400000) AS INTEGER)"
+    " ELSE {col} END"
+)
+
+# Statements used by the Database methods, kept together so the SQL is easy to review.
+# Upsert updates the existing row in place (REPLACE would delete and re-insert it)
+SQL_SET_SETTING = "INSERT INTO settings(key, value) VALUES(?, ?) ON CONFLICT(key) DO UPDATE SET value=excluded.value"
+SQL_GET_SETTING = "SELECT value FROM settings WHERE key=?"
+SQL_DELETE_SETTING = "DELETE FROM settings WHERE key=?"
+SQL_INSERT_ASSET = "INSERT INTO assets(asset_type, asset_id, status) VALUES(?, ?, 'available')"
+# One history insert per action, with the action (and NULL actor) inlined as literals
+SQL_HIST_ADDED = "INSERT INTO history(asset_type, asset_id, action, actor, timestamp) VALUES(?,?,'added',NULL,?)"
+SQL_HIST_REMOVED = "INSERT INTO history(asset_type, asset_id, action, actor, timestamp) VALUES(?,?,'removed',NULL,?)"
+SQL_HIST_CHECKED_OUT = "INSERT INTO history(asset_type, asset_id, action, actor, timestamp) VALUES(?,?,'checked_out',?,?)"
+SQL_HIST_CHECKED_IN = "INSERT INTO history(asset_type, asset_id, action, actor, timestamp) VALUES(?,?,'checked_in',?,?)"
+SQL_ASSET_EXISTS = "SELECT 1 FROM assets WHERE asset_type=? AND asset_id=?"
+SQL_DELETE_ASSET = "DELETE FROM assets WHERE asset_type=? AND asset_id=?"
+SQL_LIST_ASSETS = """
+SELECT asset_id as id, asset_type as type, status, checked_out_by, checked_out_at
+FROM assets ORDER BY type, id
+"""
+SQL_LIST_CHECKED_OUT = """
+SELECT asset_id as id, asset_type as type, status, checked_out_by, checked_out_at
+FROM assets WHERE status='checked_out' ORDER BY type, id
+"""
+SQL_UPDATE_CHECKOUT = """
+UPDATE assets
+   SET status='checked_out', checked_out_by=?, checked_out_at=?
+ WHERE asset_type=? AND asset_id=? AND status='available'
+"""
+SQL_SELECT_STATUS = "SELECT status FROM assets WHERE asset_type=? AND asset_id=?"
+# norm_name() is registered on the connection so the name match is the same
+# case-insensitive Unicode comparison as before (SQLite's lower() is ASCII-only)
+SQL_UPDATE_CHECKIN = """
+UPDATE assets
+   SET status='available', checked_out_by=NULL, checked_out_at=NULL
+ WHERE asset_type=? AND asset_id=? AND status='checked_out'
+   AND norm_name(checked_out_by) = norm_name(?)
+"""
+SQL_REPORT = """
+  SELECT asset_id, asset_type, checked_out_by, checked_out_at
+    FROM assets
+   WHERE status='checked_out'
+ORDER BY asset_type, asset_id
+"""
 
 # ---------------------------- Database Layer ---------------------------- #
 class Database:
     def __init__(self, path: str = DB_FILE):
         self.path = path
+        # One connection for the app's lifetime; transactions are opened explicitly
+        self.conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        # Serializes use of the shared connection between the GUI thread and the DB worker,
+        # so a statement from one thread never lands inside the other's open transaction
+        self._lock = threading.RLock()
+        self._settings_cache: Dict[str, Optional[str]] = {}
+        self._configure()
         self._ensure_db()
+        # Refresh planner stats for anything _ensure_db just created or migrated
+        self.conn.execute("PRAGMA optimize")
+
+    def close(self) -> None:
+        with self._lock:
+            # Lightweight ANALYZE of tables that changed this session, so the next launch plans well
+            self.conn.execute("PRAGMA optimize")
+            self.conn.close()
+
+    def _configure(self):
+        self.conn.create_function("norm_name", 1, norm_name, deterministic=True)
+        # WAL + NORMAL sync: one fsync per checkpoint instead of per commit
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        self.conn.execute("PRAGMA cache_size=-64000")  # ~64 MB
+        self.conn.execute("PRAGMA mmap_size=268435456")  # 256 MB
+
+    @contextmanager
+    def _transaction(self):
+        with self._lock:
+            # IMMEDIATE takes the write lock up front, avoiding a shared->reserved upgrade mid-transaction
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self.conn
+                self.conn.execute("COMMIT")
+            except BaseException:
+                # SQLite may already have rolled back on its own (e.g. SQLITE_FULL)
+                if self.conn.in_transaction:
+                    self.conn.execute("ROLLBACK")
+                raise
 
     def _ensure_db(self):
-        with sqlite3.connect(self.path) as conn:
-            c = conn.cursor()
-            # Assets with composite primary key (asset_type, asset_id)
-            c.execute(
+        # Schema + seed in one transaction: a single commit at startup
+        with self._transaction() as conn:
+            conn.execute(SQL_CREATE_ASSETS)
+            conn.execute(SQL_CREATE_HISTORY)
+            conn.execute(SQL_CREATE_SETTINGS)
+            self._migrate_schema(conn)
+            # Partial index matching the checked-out listing / report predicate
+            conn.execute(
                 """
-                CREATE TABLE IF NOT EXISTS assets (
-                    asset_type TEXT NOT NULL,
-                    asset_id   INTEGER NOT NULL,
-                    status TEXT NOT NULL DEFAULT 'available',
-                    checked_out_by TEXT,
-                    checked_out_at TEXT,
-                    PRIMARY KEY (asset_type, asset_id)
-                )
+                CREATE INDEX IF NOT EXISTS idx_assets_checked_out
+                    ON assets(asset_type, asset_id) WHERE status='checked_out'
                 """
             )
-            # History (append-only audit)
-            c.execute(
-                """
-                CREATE TABLE IF NOT EXISTS history (
-                    event_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    asset_type TEXT NOT NULL,
-                    asset_id   INTEGER NOT NULL,
-                    action TEXT NOT NULL, -- added | checked_out | checked_in | removed
-                    actor TEXT,
-                    timestamp TEXT NOT NULL
-                )
-                """
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_history_asset ON history(asset_type, asset_id)")
+            self._ensure_admin_password(conn)
+
+    @staticmethod
+    def _column_type(conn: sqlite3.Connection, table: str, column: str) -> Optional[str]:
+        for _, name, col_type, *_ in conn.execute(f"PRAGMA table_info({table})"):
+            if name == column:
+                return col_type.upper()
+        return None
+
+    @staticmethod
+    def _is_without_rowid(conn: sqlite3.Connection, table: str) -> bool:
+        row = conn.execute("SELECT sql FROM sqlite_master WHERE type='table' AND name=?", (table,)).fetchone()
+        return bool(row) and "WITHOUT ROWID" in row[0].upper()
+
+    @staticmethod
+    def _rebuild_table(conn: sqlite3.Connection, table: str, create_sql: str, columns: str, select: str) -> None:
+        # The table's indexes follow the rename and are dropped with it; _ensure_db recreates them
+        conn.execute(f"ALTER TABLE {table} RENAME TO {table}_legacy")
+        conn.execute(create_sql)
+        conn.execute(f"INSERT INTO {table}({columns}) SELECT {select} FROM {table}_legacy")
+        conn.execute(f"DROP TABLE {table}_legacy")
+
+    def _migrate_schema(self, conn: sqlite3.Connection) -> None:
+        """Bring tables created by older versions up to the current layout, keeping their rows.
+
+        - ISO-8601 TEXT timestamps become epoch-ms INTEGERs.
+        - assets becomes a WITHOUT ROWID table clustered on (asset_type, asset_id).
+        - settings becomes a WITHOUT ROWID table keyed on key.
+        """
+        if self._column_type(conn, "history", "timestamp") == "TEXT":
+            self._rebuild_table(
+                conn, "history", SQL_CREATE_HISTORY,
+                "event_id, asset_type, asset_id, action, actor, timestamp",
+                f"event_id, asset_type, asset_id, action, actor, {SQL_ISO_TO_MS.format(col='timestamp')}",
             )
-            # Settings (key-value). Stores admin_password, etc.
-            c.execute(
-                """
-                CREATE TABLE IF NOT EXISTS settings (
-                    key TEXT PRIMARY KEY,
-                    value TEXT
-                )
-                """
+        if (self._column_type(conn, "assets", "checked_out_at") == "TEXT"
+                or not self._is_without_rowid(conn, "assets")):
+            self._rebuild_table(
+                conn, "assets", SQL_CREATE_ASSETS,
+                "asset_type, asset_id, status, checked_out_by, checked_out_at",
+                f"asset_type, asset_id, status, checked_out_by, {SQL_ISO_TO_MS.format(col='checked_out_at')}",
             )
-            # Default admin password
-            c.execute("INSERT OR IGNORE INTO settings(key, value) VALUES('admin_password','admin123')")
-            conn.commit()
+        if not self._is_without_rowid(conn, "settings"):
+            self._rebuild_table(conn, "settings", SQL_CREATE_SETTINGS, "key, value", "key, value")
+
+    def _ensure_admin_password(self, conn: sqlite3.Connection) -> None:
+        """Seed the default admin password, hashing a plaintext one left by older versions."""
+        if conn.execute(SQL_GET_SETTING, ("admin_password_hash",)).fetchone():
+            return
+        row = conn.execute(SQL_GET_SETTING, ("admin_password",)).fetchone()
+        password = (row and row[0]) or DEFAULT_ADMIN_PASSWORD
+        conn.execute(SQL_SET_SETTING, ("admin_password_hash", hash_password(password)))
+        conn.execute(SQL_DELETE_SETTING, ("admin_password",))
 
     # ---- Settings helpers ---- #
     def set_setting(self, key: str, value: str) -> None:
-        with sqlite3.connect(self.path) as conn:
-            conn.execute("REPLACE INTO settings(key, value) VALUES(?, ?)", (key, value))
-            conn.commit()
+        with self._lock:
+            self.conn.execute(SQL_SET_SETTING, (key, value))
+            self._settings_cache[key] = value
 
     def get_setting(self, key: str, default: Optional[str] = None) -> Optional[str]:
-        with sqlite3.connect(self.path) as conn:
-            cur = conn.execute("SELECT value FROM settings WHERE key=?", (key,))
-            row = cur.fetchone()
-            return row[0] if row else default
+        # Settings only change through set_setting, so a hit never goes stale
+        if key in self._settings_cache:
+            return self._settings_cache[key]
+        with self._lock:
+            row = self.conn.execute(SQL_GET_SETTING, (key,)).fetchone()
+        if not row:
+            return default
+        self._settings_cache[key] = row[0]
+        return row[0]
+
+    # ---- Admin password (salted scrypt hash; the stored hash is cached with the other settings) ---- #
+    def set_admin_password(self, password: str) -> None:
+        self.set_setting("admin_password_hash", hash_password(password))
+
+    def verify_admin_password(self, password: str) -> bool:
+        stored = self.get_setting("admin_password_hash")
+        return stored is not None and verify_password(password, stored)
 
     # ---- Asset operations (composite key: asset_type + asset_id) ---- #
     def add_asset(self, asset_id: int, asset_type: str) -> None:
-        with sqlite3.connect(self.path) as conn:
-            conn.execute(
-                "INSERT INTO assets(asset_type, asset_id, status) VALUES(?, ?, 'available')",
-                (asset_type, asset_id),
-            )
-            conn.execute(
-                "INSERT INTO history(asset_type, asset_id, action, actor, timestamp) VALUES(?,?,?,?,?)",
-                (asset_type, asset_id, 'added', None, datetime.utcnow().isoformat()),
-            )
-            conn.commit()
+        with self._transaction() as conn:
+            conn.execute(SQL_INSERT_ASSET, (asset_type, asset_id))
+            conn.execute(SQL_HIST_ADDED, (asset_type, asset_id, now_ms()))
+
+    def add_assets_bulk(self, items: List[Tuple[int, str]]) -> None:
+        """Add many (asset_id, asset_type) pairs in a single transaction; all-or-nothing."""
+        ts = now_ms()
+        with self._transaction() as conn:
+            conn.executemany(SQL_INSERT_ASSET, [(a_type, a_id) for a_id, a_type in items])
+            conn.executemany(SQL_HIST_ADDED, [(a_type, a_id, ts) for a_id, a_type in items])
 
     def remove_asset(self, asset_id: int, asset_type: str) -> None:
-        with sqlite3.connect(self.path) as conn:
-            cur = conn.execute(
-                "SELECT 1 FROM assets WHERE asset_type=? AND asset_id=?",
-                (asset_type, asset_id),
-            )
-            if not cur.fetchone():
+        with self._transaction() as conn:
+            if conn.execute(SQL_DELETE_ASSET, (asset_type, asset_id)).rowcount == 0:
                 raise ValueError("Asset not found")
-            conn.execute(
-                "DELETE FROM assets WHERE asset_type=? AND asset_id=?",
-                (asset_type, asset_id),
-            )
-            conn.execute(
-                "INSERT INTO history(asset_type, asset_id, action, actor, timestamp) VALUES(?,?,?,?,?)",
-                (asset_type, asset_id, 'removed', None, datetime.utcnow().isoformat()),
-            )
-            conn.commit()
+            conn.execute(SQL_HIST_REMOVED, (asset_type, asset_id, now_ms()))
 
     def list_assets(self, only_checked_out: bool = False) -> List[Tuple]:
-        with sqlite3.connect(self.path) as conn:
-            if only_checked_out:
-                cur = conn.execute(
-                    """
-                    SELECT asset_id as id, asset_type as type, status, checked_out_by, checked_out_at
-                    FROM assets WHERE status='checked_out' ORDER BY type, id
-                    """
-                )
-            else:
-                cur = conn.execute(
-                    """
-                    SELECT asset_id as id, asset_type as type, status, checked_out_by, checked_out_at
-                    FROM assets ORDER BY type, id
-                    """
-                )
-            return cur.fetchall()
-
-    def checkout(self, asset_id: int, asset_type: str, student: str) -> None:
-        with sqlite3.connect(self.path) as conn:
-            cur = conn.execute(
-                "SELECT status FROM assets WHERE asset_type=? AND asset_id=?",
-                (asset_type, asset_id),
-            )
-            row = cur.fetchone()
-            if not row:
-                raise ValueError("Asset not found.")
-            if row[0] != 'available':
+        with self._lock:
+            return self.conn.execute(SQL_LIST_CHECKED_OUT if only_checked_out else SQL_LIST_ASSETS).fetchall()
+
+    def checkout(self, asset_id: int, asset_type: str, student: str) -> int:
+        """Check an asset out to student; returns the checkout timestamp (epoch ms)."""
+        ts = now_ms()
+        with self._transaction() as conn:
+            cur = conn.execute(SQL_UPDATE_CHECKOUT, (student.strip(), ts, asset_type, asset_id))
+            if cur.rowcount == 0:
+                # Only hit the table again to pick the right error message
+                if not conn.execute(SQL_ASSET_EXISTS, (asset_type, asset_id)).fetchone():
+                    raise ValueError("Asset not found.")
                 raise ValueError("Asset is not available.")
-            ts = datetime.utcnow().isoformat()
-            conn.execute(
-                """
-                UPDATE assets
-                   SET status='checked_out', checked_out_by=?, checked_out_at=?
-                 WHERE asset_type=? AND asset_id=?
-                """,
-                (student.strip(), ts, asset_type, asset_id),
-            )
-            conn.execute(
-                "INSERT INTO history(asset_type, asset_id, action, actor, timestamp) VALUES(?,?,?,?,?)",
-                (asset_type, asset_id, 'checked_out', student.strip(), ts),
-            )
-            conn.commit()
+            conn.execute(SQL_HIST_CHECKED_OUT, (asset_type, asset_id, student.strip(), ts))
+        return ts
 
     def checkin(self, asset_id: int, asset_type: str, student: str) -> None:
-        with sqlite3.connect(self.path) as conn:
-            cur = conn.execute(
-                "SELECT status, checked_out_by FROM assets WHERE asset_type=? AND asset_id=?",
-                (asset_type, asset_id),
-            )
-            row = cur.fetchone()
-            if not row:
-                raise ValueError("Asset not found.")
-            status, by = row
-            if status != 'checked_out':
-                raise ValueError("Asset is not checked out.")
-            if (by or '').strip().lower() != student.strip().lower():
+        ts = now_ms()
+        with self._transaction() as conn:
+            cur = conn.execute(SQL_UPDATE_CHECKIN, (asset_type, asset_id, student.strip()))
+            if cur.rowcount == 0:
+                # Only hit the table again to pick the right error message
+                row = conn.execute(SQL_SELECT_STATUS, (asset_type, asset_id)).fetchone()
+                if not row:
+                    raise ValueError("Asset not found.")
+                if row[0] != 'checked_out':
+                    raise ValueError("Asset is not checked out.")
                 raise ValueError("Student name does not match checkout record.")
-            ts = datetime.utcnow().isoformat()
-            conn.execute(
-                """
-                UPDATE assets
-                   SET status='available', checked_out_by=NULL, checked_out_at=NULL
-                 WHERE asset_type=? AND asset_id=?
-                """,
-                (asset_type, asset_id),
-            )
-            conn.execute(
-                "INSERT INTO history(asset_type, asset_id, action, actor, timestamp) VALUES(?,?,?,?,?)",
-                (asset_type, asset_id, 'checked_in', student.strip(), ts),
-            )
-            conn.commit()
+            conn.execute(SQL_HIST_CHECKED_IN, (asset_type, asset_id, student.strip(), ts))
+
+    def iter_report_data(self) -> Iterator[Tuple]:
+        """Yield rows for currently checked out assets: (asset_id, asset_type, checked_out_by, checked_out_at)."""
+        # The lock is taken per batch, never held across a yield: a paused or abandoned
+        # generator must not block the DB worker thread
+        with self._lock:
+            cur = self.conn.execute(SQL_REPORT)
+        while True:
+            with self._lock:
+                batch = cur.fetchmany(REPORT_BATCH_SIZE)
+            if not batch:
+                return
+            yield from batch
 
     def get_report_data(self) -> List[Tuple]:
-        """Return rows for currently checked out assets: (asset_id, asset_type, checked_out_by, checked_out_at)."""
-        with sqlite3.connect(self.path) as conn:
-            cur = conn.execute(
-                """
-                SELECT asset_id, asset_type, checked_out_by, checked_out_at
-                  FROM assets
-                 WHERE status='checked_out'
-              ORDER BY asset_type, asset_id
-                """
-            )
-            return cur.fetchall()
+        """Materialized form of iter_report_data()."""
+        return list(self.iter_report_data())
+
+# ---------------------------- Background DB Worker ---------------------------- #
+class DbWorkerSignals(QObject):
+    finished = Signal(object)  # return value of the call
+    failed = Signal(object)    # exception raised by the call
+
+
+class DbWorker(QRunnable):
+    """Runs one Database call off the GUI thread and reports back through signals."""
+
+    def __init__(self, fn, *args):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.signals = DbWorkerSignals()
+
+    def run(self):
+        try:
+            result = self.fn(*self.args)
+        except Exception as e:
+            self.signals.failed.emit(e)
+        else:
+            self.signals.finished.emit(result)
 
 # ---------------------------- UI Styling ---------------------------- #
 ASSET_QSS = """
@@ -218,9 +394,54 @@ class AssetTrackerApp(QMainWindow):
         self.setWindowTitle("Eagle Eye")
         self.setMinimumSize(980, 640)
         self.db = Database()
+        # One validator shared by every asset-ID field; parented to the window so Qt owns it
+        self.id_validator = QIntValidator(1, MAX_ASSET_ID, self)
+        self._table_rows: Optional[List[Tuple]] = None  # last rows rendered in the inventory table
+        self._row_index: Dict[Tuple[str, int], int] = {}  # (asset_type, asset_id) -> table row
+        # Writes run here so an fsync never stalls the event loop; one thread keeps them in order
+        self._db_pool = QThreadPool(self)
+        self._db_pool.setMaxThreadCount(1)
+        self._db_jobs = set()  # keeps running workers (and their signals) alive until they report back
+        self._closing = False  # set in closeEvent; results queued after that are dropped
         self._init_ui()
         self._refresh_tables()
 
+    def closeEvent(self, event):
+        # Jobs finishing during waitForDone() queue their callbacks behind this event; they
+        # must not touch the UI or the connection once it is closed
+        self._closing = True
+        self._db_pool.waitForDone()
+        self.db.close()
+        super().closeEvent(event)
+
+    def _submit(self, fn, args, on_done, on_error=None):
+        """Run fn(*args) on the DB thread; on_done(result) / on_error(exc) are called on the GUI thread."""
+        worker = DbWorker(fn, *args)
+        self._db_jobs.add(worker)
+
+        def release():
+            # The signals object holds these closures (which hold worker), a cycle the GC
+            # can't see through; deleting the QObject breaks it
+            self._db_jobs.discard(worker)
+            worker.signals.deleteLater()
+
+        def finished(result):
+            release()
+            if not self._closing:
+                on_done(result)
+
+        def failed(exc):
+            release()
+            if not self._closing:
+                (on_error or self._show_error)(exc)
+
+        worker.signals.finished.connect(finished)
+        worker.signals.failed.connect(failed)
+        self._db_pool.start(worker)
+
+    def _show_error(self, exc):
+        QMessageBox.critical(self, "Error", str(exc))
+
     def _init_ui(self):
         self.tabs = QTabWidget()
         self.tabs.setMovable(True)
@@ -267,13 +488,13 @@ class AssetTrackerApp(QMainWindow):
         self.type_combo.setEditable(False)
 
         self.id_input = QLineEdit()
-        self.id_input.setValidator(QIntValidator(1, 10**9))
+        self.id_input.setValidator(self.id_validator)
 
         add_btn = QPushButton("Add Asset")
         add_btn.clicked.connect(self._on_add_asset)
 
         self.remove_input = QLineEdit()
-        self.remove_input.setValidator(QIntValidator(1, 10**9))
+        self.remove_input.setValidator(self.id_validator)
         remove_btn = QPushButton("Remove Asset")
         remove_btn.clicked.connect(self._on_remove_asset)
 
@@ -306,13 +527,39 @@ class AssetTrackerApp(QMainWindow):
 
     def _refresh_tables(self):
         rows = self.db.list_assets()
-        self.table.setRowCount(0)
-        for r in rows:
-            row_idx = self.table.rowCount()
-            self.table.insertRow(row_idx)
-            for col, val in enumerate(r):
-                it = QTableWidgetItem("" if val is None else str(val))
-                self.table.setItem(row_idx, col, it)
+        if rows == self._table_rows:
+            return  # nothing moved, skip the rebuild
+        self._table_rows = rows
+        self._row_index = {(r[1], r[0]): i for i, r in enumerate(rows)}
+        sorting = self.table.isSortingEnabled()
+        self.table.setSortingEnabled(False)
+        self.table.setUpdatesEnabled(False)
+        try:
+            reusable = self.table.rowCount()
+            self.table.setRowCount(len(rows))
+            for row_idx, r in enumerate(rows):
+                if row_idx < reusable:
+                    # Rows already on screen keep their items; only the text is reset
+                    for col, text in enumerate(format_row(r)):
+                        self.table.item(row_idx, col).setText(text)
+                else:
+                    for col, text in enumerate(format_row(r)):
+                        self.table.setItem(row_idx, col, QTableWidgetItem(text))
+        finally:
+            self.table.setUpdatesEnabled(True)
+            self.table.setSortingEnabled(sorting)
+
+    def _update_row(self, a_id: int, a_type: str, status: str,
+                    by: Optional[str] = None, at: Optional[int] = None):
+        """Patch one inventory row in place after a status change; full refresh if it isn't shown."""
+        row_idx = self._row_index.get((a_type, a_id))
+        if row_idx is None:
+            self._refresh_tables()
+            return
+        row = self._table_rows[row_idx] = (a_id, a_type, status, by, at)
+        cells = format_row(row)
+        for col in (2, 3, 4):
+            self.table.item(row_idx, col).setText(cells[col])
 
     def _on_add_asset(self):
         a_type = self.type_combo.currentText().strip()
@@ -324,15 +571,19 @@ class AssetTrackerApp(QMainWindow):
         except ValueError:
             QMessageBox.warning(self, "Validation", "Asset ID must be an integer.")
             return
-        try:
-            self.db.add_asset(a_id, a_type)
+
+        def done(_):
             self.id_input.clear()
             QMessageBox.information(self, "Success", f"Added {a_type} #{a_id}.")
             self._refresh_tables()
-        except sqlite3.IntegrityError:
-            QMessageBox.critical(self, "Error", "That type+ID already exists.")
-        except Exception as e:
-            QMessageBox.critical(self, "Error", str(e))
+
+        def failed(e):
+            if isinstance(e, sqlite3.IntegrityError):
+                QMessageBox.critical(self, "Error", "That type+ID already exists.")
+            else:
+                self._show_error(e)
+
+        self._submit(self.db.add_asset, (a_id, a_type), done, failed)
 
     def _on_remove_asset(self):
         text = self.remove_input.text().strip()
@@ -344,12 +595,12 @@ class AssetTrackerApp(QMainWindow):
         confirm = QMessageBox.question(self, "Confirm", f"Remove {a_type} #{a_id}? This cannot be undone.")
         if confirm != QMessageBox.Yes:
             return
-        try:
-            self.db.remove_asset(a_id, a_type)
+
+        def done(_):
             QMessageBox.information(self, "Removed", f"{a_type} #{a_id} was removed.")
             self._refresh_tables()
-        except Exception as e:
-            QMessageBox.critical(self, "Error", str(e))
+
+        self._submit(self.db.remove_asset, (a_id, a_type), done)
 
     # ---------- Checkout UI ---------- #
     def _build_checkout_group(self) -> QGroupBox:
@@ -361,7 +612,7 @@ class AssetTrackerApp(QMainWindow):
         self.co_type.setEditable(False)
 
         self.co_id = QLineEdit()
-        self.co_id.setValidator(QIntValidator(1, 10**9))
+        self.co_id.setValidator(self.id_validator)
         self.co_name = QLineEdit()
 
         btn = QPushButton("Check Out")
@@ -385,13 +636,13 @@ class AssetTrackerApp(QMainWindow):
         if not a_type or not name:
             QMessageBox.warning(self, "Validation", "Type and student name are required.")
             return
-        try:
-            self.db.checkout(a_id, a_type, name)
+
+        def done(ts):
             QMessageBox.information(self, "Checked Out", f"{a_type} #{a_id} checked out to {name}.")
             self.co_id.clear(); self.co_name.clear()
-            self._refresh_tables()
-        except Exception as e:
-            QMessageBox.critical(self, "Error", str(e))
+            self._update_row(a_id, a_type, 'checked_out', name, ts)
+
+        self._submit(self.db.checkout, (a_id, a_type, name), done)
 
     # ---------- Check-in UI ---------- #
     def _build_checkin_group(self) -> QGroupBox:
@@ -403,7 +654,7 @@ class AssetTrackerApp(QMainWindow):
         self.ci_type.setEditable(False)
 
         self.ci_id = QLineEdit()
-        self.ci_id.setValidator(QIntValidator(1, 10**9))
+        self.ci_id.setValidator(self.id_validator)
         self.ci_name = QLineEdit()
 
         btn = QPushButton("Check In")
@@ -427,13 +678,13 @@ class AssetTrackerApp(QMainWindow):
         if not a_type or not name:
             QMessageBox.warning(self, "Validation", "Type and student name are required.")
             return
-        try:
-            self.db.checkin(a_id, a_type, name)
+
+        def done(_):
             QMessageBox.information(self, "Checked In", f"{a_type} #{a_id} checked in by {name}.")
             self.ci_id.clear(); self.ci_name.clear()
-            self._refresh_tables()
-        except Exception as e:
-            QMessageBox.critical(self, "Error", str(e))
+            self._update_row(a_id, a_type, 'available')
+
+        self._submit(self.db.checkin, (a_id, a_type, name), done)
 
     # ---------- Reports ---------- #
     def _build_report_group(self):
@@ -454,32 +705,34 @@ class AssetTrackerApp(QMainWindow):
     def _on_tab_changed(self, index):
         # Only prompt once per launch for Inventory tab (index 0)
         if index == 0 and not self.admin_verified:
-            stored_pw = self.db.get_setting("admin_password", "admin123")
             pw, ok = QInputDialog.getText(self, "Inventory Password", "Enter admin password:", QLineEdit.Password)
-            if not ok or pw != stored_pw:
+            if not ok or not self.db.verify_admin_password(pw):
                 QMessageBox.warning(self, "Access Denied", "Incorrect password. Switching to another tab.")
                 self.tabs.setCurrentIndex(1)
             else:
                 self.admin_verified = True
 
     def _generate_report(self):
-        rows = self.db.get_report_data()
-        if not rows:
+        rows = self.db.iter_report_data()
+        first = next(rows, None)
+        if first is None:
             QMessageBox.information(self, "Report", "All good, nothing is currently checked out.")
             return
         report_path = os.path.join(os.path.dirname(DB_FILE), "checked_out_report.txt")
         with open(report_path, "w", encoding="utf-8") as f:
             f.write("Checked Out Assets Report\n\n")
-            for asset_id, asset_type, student, ts in rows:
-                f.write(f"ID: {asset_id}, Type: {asset_type}, Student: {student}, Time: {ts}\n")
+            # Stream straight from the cursor; no intermediate list of rows or lines
+            f.writelines(
+                f"ID: {asset_id}, Type: {asset_type}, Student: {student}, Time: {format_ts(ts)}\n"
+                for asset_id, asset_type, student, ts in chain((first,), rows)
+            )
         QMessageBox.information(self, "Report", f"Report saved to {report_path}")
 
     def _change_password(self):
         current_pw, ok = QInputDialog.getText(self, "Verify Password", "Enter current admin password:", QLineEdit.Password)
         if not ok:
             return
-        stored_pw = self.db.get_setting("admin_password", "admin123")
-        if current_pw != stored_pw:
+        if not self.db.verify_admin_password(current_pw):
             QMessageBox.warning(self, "Error", "Current password is incorrect.")
             return
         new_pw, ok = QInputDialog.getText(self, "New Password", "Enter new admin password:", QLineEdit.Password)
@@ -490,7 +743,7 @@ class AssetTrackerApp(QMainWindow):
         if not ok or new_pw != confirm_pw:
             QMessageBox.warning(self, "Error", "Passwords do not match.")
             return
-        self.db.set_setting("admin_password", new_pw.strip())
+        self.db.set_admin_password(new_pw.strip())
         QMessageBox.information(self, "Success", "Admin password updated successfully.")
 
 # ---------------------------- App Bootstrap ---------------------------- #